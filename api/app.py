@@ -1,10 +1,28 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 import pymysql
-from werkzeug.security import generate_password_hash, check_password_hash
+from dbutils.pooled_db import PooledDB
+import redis
+import orjson
+import brotli
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 import jwt
-from functools import wraps
+import msgspec
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from typing import Annotated, Literal
+from cachetools import TLRUCache, TTLCache
 import datetime
+import decimal
+import gzip
+import hashlib
+import threading
+import time
+import types
 import os
 
 # -----------------------
@@ -14,169 +32,487 @@ app = Flask(__name__)
 
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "https://penaura-frontend.vercel.app")
 SECRET_KEY = os.environ.get("SECRET_KEY", "supersecretkey")
+TOKEN_LIFETIME = 7 * 24 * 60 * 60
 
 MYSQL_HOST = os.environ.get("MYSQL_HOST")
 MYSQL_USER = os.environ.get("MYSQL_USER")
 MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD")
 MYSQL_DB = os.environ.get("MYSQL_DB")
 
-CORS(app, supports_credentials=True, resources={r"/*": {"origins": FRONTEND_URL}})
+REDIS_URL = os.environ.get("REDIS_URL")
+POSTS_CACHE_TTL = int(os.environ.get("POSTS_CACHE_TTL", 30))
+POSTS_PAGE_SIZE = 20
+MAX_POSTS_PAGE_SIZE = 100
+
+# Browsers cache the preflight for a day instead of repeating it before every write
+CORS(app, supports_credentials=True, resources={r"/*": {
+    "origins": FRONTEND_URL,
+    "max_age": 86400,
+    "allow_headers": ["Content-Type", "Authorization"],
+    "methods": ["GET", "POST", "PUT", "DELETE"]
+}})
+
+@app.before_request
+def answer_preflight():
+    # flask-cors fills in the preflight headers after the request, so skip the view
+    # and table setup entirely
+    if request.method == "OPTIONS":
+        return app.response_class(status=204)
+
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
 
 # -----------------------
 # Database Helper
 # -----------------------
+# Built on first use so a cold start doesn't open MySQL connections at import time
+@lru_cache(maxsize=1)
+def get_pool():
+    return PooledDB(
+        creator=pymysql,
+        mincached=2,
+        maxcached=10,
+        maxconnections=20,
+        blocking=True,
+        ping=1,
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        database=MYSQL_DB,
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=False
+    )
+
 def get_db():
+    # conn.close() hands the connection back to the pool instead of closing it
     try:
-        conn = pymysql.connect(
-            host=MYSQL_HOST,
-            user=MYSQL_USER,
-            password=MYSQL_PASSWORD,
-            database=MYSQL_DB,
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        return conn
+        return get_pool().connection()
     except Exception as e:
         print("DB connection failed:", e)
         raise
 
+@contextmanager
+def db():
+    conn = get_db()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+# -----------------------
+# Queries
+# -----------------------
+SQL_INSERT_USER = "INSERT INTO users (name, email, password) VALUES (%s, %s, %s) ON DUPLICATE KEY UPDATE id=id"
+SQL_LOGIN_LOOKUP = "SELECT id, name, email, created_at, password FROM users WHERE email=%s LIMIT 1"
+SQL_UPDATE_PASSWORD = "UPDATE users SET password=%s WHERE id=%s"
+SQL_INSERT_POST = "INSERT INTO posts (user_id, title, category, content) VALUES (%s, %s, %s, %s)"
+# Ratings are aggregated per post through idx_ratings_post instead of a GROUP BY, so
+# ORDER BY ... LIMIT can walk idx_posts_created_desc and stop after one page
+SQL_SELECT_POSTS = """
+    SELECT p.id, p.title, p.category, p.content, p.created_at, u.name as author,
+           IFNULL((SELECT ROUND(AVG(r.rating),2) FROM ratings r WHERE r.post_id = p.id), 0) as avg_rating,
+           (SELECT COUNT(r.rating) FROM ratings r WHERE r.post_id = p.id) as total_votes
+    FROM posts p
+    JOIN users u ON p.user_id = u.id
+"""
+SQL_ORDER_POSTS = " ORDER BY p.created_at DESC, p.id DESC"
+SQL_LIST_POSTS = SQL_SELECT_POSTS + SQL_ORDER_POSTS
+SQL_LIST_POSTS_PAGE = SQL_LIST_POSTS + " LIMIT %s"
+# Keyset page: rows strictly after the (created_at, id) of the previous page's last row
+SQL_LIST_POSTS_AFTER = (
+    SQL_SELECT_POSTS
+    + " WHERE (p.created_at < %s OR (p.created_at = %s AND p.id < %s))"
+    + SQL_ORDER_POSTS
+    + " LIMIT %s"
+)
+POST_COLUMNS = ("id", "title", "category", "content", "created_at", "author", "avg_rating", "total_votes")
+
+# -----------------------
+# Cache Helper
+# -----------------------
+# Each process keeps a short-lived copy in front of Redis (or alone, when REDIS_URL
+# is unset). Redis errors never fail a request.
+POSTS_FEED_KEY = "posts:feed:v1"
+POSTS_PAGE_KEY = "posts:page:v1"
+LOCAL_CACHE_TTL = 5
+
+REDIS_TIMEOUT = 0.2
+
+redis_client = redis.Redis.from_url(
+    REDIS_URL,
+    socket_connect_timeout=REDIS_TIMEOUT,
+    socket_timeout=REDIS_TIMEOUT
+) if REDIS_URL else None
+_LOCAL_CACHE = TTLCache(maxsize=128, ttl=LOCAL_CACHE_TTL)
+_LOCAL_LOCK = threading.Lock()
+
+def cache_get(key):
+    with _LOCAL_LOCK:
+        value = _LOCAL_CACHE.get(key)
+    if value is not None or not redis_client:
+        return value
+    try:
+        value = redis_client.get(key)
+    except redis.RedisError as e:
+        print("Cache read failed:", e)
+        return None
+    if value is not None:
+        with _LOCAL_LOCK:
+            _LOCAL_CACHE[key] = value
+    return value
+
+def cache_set(key, value, ttl):
+    with _LOCAL_LOCK:
+        _LOCAL_CACHE[key] = value
+    if not redis_client:
+        return
+    try:
+        redis_client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        print("Cache write failed:", e)
+
+def cache_delete(*keys):
+    with _LOCAL_LOCK:
+        for key in keys:
+            _LOCAL_CACHE.pop(key, None)
+    if not redis_client:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as e:
+        print("Cache delete failed:", e)
+
+# -----------------------
+# JSON Helper
+# -----------------------
+def json_default(obj):
+    # orjson has no Decimal support; keep the string form jsonify produced
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    raise TypeError
+
+def dump_json(obj):
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_NAIVE_UTC)
+
+def json_response(body):
+    return app.response_class(body, mimetype="application/json")
+
+# Cached bodies are stored once per encoding at fill time, so a cache hit is served
+# as-is instead of being recompressed by Flask-Compress on every request
+COMPRESSED_ENCODINGS = ("br", "gzip")
+
+def variant_key(key, encoding=None):
+    return f"{key}:{encoding}" if encoding else key
+
+def variant_keys(*keys):
+    return [variant_key(key, encoding) for key in keys for encoding in (None,) + COMPRESSED_ENCODINGS]
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=app.config["COMPRESS_BR_LEVEL"])
+    return gzip.compress(body, compresslevel=app.config["COMPRESS_LEVEL"])
+
+def encoded_json_response(body, encoding=None):
+    # Flask-Compress leaves responses that already carry a Content-Encoding alone
+    response = json_response(body)
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+def cache_json(key, body, ttl):
+    variants = {None: body}
+    if len(body) >= app.config["COMPRESS_MIN_SIZE"]:
+        for encoding in COMPRESSED_ENCODINGS:
+            variants[encoding] = compress(body, encoding)
+    for encoding, value in variants.items():
+        cache_set(variant_key(key, encoding), value, ttl)
+    return variants
+
+def variant_response(variants):
+    encoding = request.accept_encodings.best_match(COMPRESSED_ENCODINGS)
+    if encoding in variants:
+        return encoded_json_response(variants[encoding], encoding)
+    return encoded_json_response(variants[None])
+
+def cached_json_response(key):
+    encoding = request.accept_encodings.best_match(COMPRESSED_ENCODINGS)
+    if encoding:
+        body = cache_get(variant_key(key, encoding))
+        if body:
+            return encoded_json_response(body, encoding)
+    body = cache_get(key)
+    return encoded_json_response(body) if body else None
+
+class ORJSONProvider(DefaultJSONProvider):
+    # Backs jsonify() and request.json with orjson
+    def dumps(self, obj, **kwargs):
+        return dump_json(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
 # -----------------------
 # Table Creation
 # -----------------------
+# Bump SCHEMA_VERSION whenever create_schema changes
+SCHEMA_VERSION = 1
+SCHEMA_LOCK = "penaura_schema"
+# Seconds to wait for the lock; stays well inside a serverless function's time limit
+SCHEMA_LOCK_TIMEOUT = 5
+
+def create_index(cur, table, name, columns):
+    # MySQL has no CREATE INDEX IF NOT EXISTS
+    cur.execute(
+        "SELECT 1 FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+        (table, name)
+    )
+    if not cur.fetchone():
+        cur.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+def create_schema(cur):
+    # Users table
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            email VARCHAR(255) UNIQUE NOT NULL,
+            password VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Posts table
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS posts (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            category ENUM('poetry','short','novel') NOT NULL,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """)
+
+    # Ratings table
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS ratings (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            post_id INT NOT NULL,
+            rating INT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, post_id),
+            FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
+            FOREIGN KEY(post_id) REFERENCES posts(id) ON DELETE CASCADE
+        )
+    """)
+
+    # Feed ordering, and the AVG/COUNT aggregation in get_posts
+    create_index(cur, "posts", "idx_posts_created_desc", "created_at DESC, id DESC")
+    create_index(cur, "ratings", "idx_ratings_post", "post_id, rating")
+
 def create_tables():
+    # Concurrent cold starts queue on a named lock, and the DDL is skipped
+    # once schema_version has caught up
     try:
-        conn = get_db()
-        with conn.cursor() as cur:
-            # Users table
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    email VARCHAR(255) UNIQUE NOT NULL,
-                    password VARCHAR(255) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Posts table
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS posts (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    title VARCHAR(255) NOT NULL,
-                    category ENUM('poetry','short','novel') NOT NULL,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Ratings table
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS ratings (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    post_id INT NOT NULL,
-                    rating INT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(user_id, post_id),
-                    FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
-                    FOREIGN KEY(post_id) REFERENCES posts(id) ON DELETE CASCADE
-                )
-            """)
-        conn.commit()
-        print("Tables created successfully")
+        with db() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT GET_LOCK(%s, %s) AS acquired", (SCHEMA_LOCK, SCHEMA_LOCK_TIMEOUT))
+                # 0 on timeout, NULL on error; never run the DDL without the lock
+                if cur.fetchone()["acquired"] != 1:
+                    raise RuntimeError("Could not acquire the schema lock")
+                try:
+                    cur.execute("CREATE TABLE IF NOT EXISTS schema_version (version INT NOT NULL PRIMARY KEY)")
+                    cur.execute("SELECT MAX(version) AS version FROM schema_version")
+                    if (cur.fetchone()["version"] or 0) >= SCHEMA_VERSION:
+                        return
+                    create_schema(cur)
+                    cur.execute("INSERT INTO schema_version (version) VALUES (%s)", (SCHEMA_VERSION,))
+                    conn.commit()
+                    print("Tables created successfully")
+                finally:
+                    cur.execute("SELECT RELEASE_LOCK(%s)", (SCHEMA_LOCK,))
     except Exception as e:
         print("Error creating tables:", e)
         raise
-    finally:
-        if conn:
-            conn.close()
 
 # -----------------------
 # JWT Helper
 # -----------------------
+# Decoded payloads are cached for up to 60s, and never past their own exp. They are
+# stored read-only because every request with the same token shares the object.
+_JWT_CACHE = TLRUCache(maxsize=10000, ttu=lambda _key, data, now: min(now + 60, data["exp"]), timer=time.time)
+_JWT_LOCK = threading.Lock()
+
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         token = request.headers.get("Authorization", "").replace("Bearer ", "")
         if not token:
             return jsonify({"error": "Token is missing!"}), 401
-        try:
-            data = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            user_id = data["user_id"]
-        except Exception as e:
-            return jsonify({"error": "Invalid token!", "details": str(e)}), 401
-        return f(user_id, *args, **kwargs)
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _JWT_LOCK:
+            data = _JWT_CACHE.get(key)
+        if not data or data["exp"] <= time.time():
+            try:
+                data = types.MappingProxyType(
+                    jwt.decode(token, SECRET_KEY, algorithms=["HS256"], options={"require": ["exp", "user_id"]})
+                )
+            except Exception as e:
+                return jsonify({"error": "Invalid token!", "details": str(e)}), 401
+            with _JWT_LOCK:
+                _JWT_CACHE[key] = data
+        g.jwt_payload = data
+        g.user_id = data["user_id"]
+        return f(g.user_id, *args, **kwargs)
     return decorated
 
+def current_user_id():
+    # Only valid inside a view wrapped by token_required
+    return g.user_id
+
+# -----------------------
+# Password Helper
+# -----------------------
+ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+def hash_password(password):
+    return ph.hash(password)
+
+def verify_password(stored, password):
+    # Returns (valid, needs_rehash); legacy werkzeug pbkdf2 hashes always need a rehash
+    if not stored.startswith("$argon2"):
+        return check_password_hash(stored, password), True
+    try:
+        ph.verify(stored, password)
+    except (VerificationError, InvalidHashError):
+        return False, False
+    return True, ph.check_needs_rehash(stored)
+
+def rehash_password(user_id, password):
+    try:
+        with db() as conn:
+            with conn.cursor() as cur:
+                cur.execute(SQL_UPDATE_PASSWORD, (hash_password(password), user_id))
+            conn.commit()
+    except Exception as e:
+        print("Password rehash failed:", e)
+
+# -----------------------
+# Request Schemas
+# -----------------------
+NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+class SignupIn(msgspec.Struct):
+    name: NonEmptyStr
+    email: NonEmptyStr
+    password: NonEmptyStr
+
+class LoginIn(msgspec.Struct):
+    email: NonEmptyStr
+    password: NonEmptyStr
+
+class PostIn(msgspec.Struct):
+    title: NonEmptyStr
+    category: Literal["poetry", "short", "novel"]
+    content: NonEmptyStr
+
+def parse_body(schema):
+    # Parses and validates the raw body in one pass; raises msgspec.DecodeError
+    return msgspec.json.decode(request.get_data(), type=schema)
+
 # -----------------------
 # Init DB route (runs table creation)
 # -----------------------
-@app.before_first_request
+# before_first_request is gone in Flask 2.3; run create_tables once per process instead.
+# A failed setup is logged and retried later rather than failing the request.
+SCHEMA_RETRY_INTERVAL = 60
+
+_tables_ready = False
+_tables_retry_at = 0
+_tables_lock = threading.Lock()
+
+@app.before_request
 def initialize_database():
-    create_tables()
+    global _tables_ready, _tables_retry_at
+    if _tables_ready or time.time() < _tables_retry_at:
+        return
+    with _tables_lock:
+        if _tables_ready or time.time() < _tables_retry_at:
+            return
+        try:
+            create_tables()
+            _tables_ready = True
+        except Exception:
+            _tables_retry_at = time.time() + SCHEMA_RETRY_INTERVAL
 
 # -----------------------
 # Auth Routes
 # -----------------------
 @app.route("/signup", methods=["POST"])
 def signup():
-    data = request.json
-    name = data.get("name")
-    email = data.get("email")
-    password = data.get("password")
-
-    if not name or not email or not password:
-        return jsonify({"error": "All fields are required"}), 400
+    try:
+        body = parse_body(SignupIn)
+    except msgspec.DecodeError as e:
+        return jsonify({"error": str(e)}), 400
+    name, email, password = body.name, body.email, body.password
 
-    hashed_password = generate_password_hash(password, method="pbkdf2:sha256")
+    hashed_password = hash_password(password)
     try:
-        conn = get_db()
-        with conn.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (name, email, password) VALUES (%s, %s, %s)",
-                (name, email, hashed_password)
-            )
-            user_id = cur.lastrowid
-        conn.commit()
+        with db() as conn:
+            with conn.cursor() as cur:
+                # A duplicate email leaves the row untouched and reports 0 affected rows
+                cur.execute(SQL_INSERT_USER, (name, email, hashed_password))
+                inserted = cur.rowcount == 1
+            conn.commit()
+        if not inserted:
+            return jsonify({"error": "Email already exists!"}), 400
         return jsonify({"message": "User registered successfully!"}), 201
-    except pymysql.err.IntegrityError:
-        return jsonify({"error": "Email already exists!"}), 400
     except Exception as e:
         return jsonify({"error": "Server error", "details": str(e)}), 500
-    finally:
-        conn.close()
 
 @app.route("/login", methods=["POST"])
 def login():
-    data = request.json
-    email = data.get("email")
-    password = data.get("password")
-
-    if not email or not password:
-        return jsonify({"error": "Email and password are required"}), 400
+    try:
+        body = parse_body(LoginIn)
+    except msgspec.DecodeError as e:
+        return jsonify({"error": str(e)}), 400
+    email, password = body.email, body.password
 
     try:
-        conn = get_db()
-        with conn.cursor() as cur:
-            cur.execute("SELECT * FROM users WHERE email=%s", (email,))
-            user = cur.fetchone()
+        with db() as conn:
+            with conn.cursor(pymysql.cursors.Cursor) as cur:
+                cur.execute(SQL_LOGIN_LOOKUP, (email,))
+                user = cur.fetchone()
     except Exception as e:
         return jsonify({"error": "Server error", "details": str(e)}), 500
-    finally:
-        conn.close()
 
-    if user and check_password_hash(user["password"], password):
+    if not user:
+        return jsonify({"error": "Invalid credentials"}), 401
+
+    user_id, name, email, created_at, pw_hash = user
+    valid, needs_rehash = verify_password(pw_hash, password)
+    if valid:
+        if needs_rehash:
+            rehash_password(user_id, password)
         token = jwt.encode(
-            {"user_id": user["id"], "exp": datetime.datetime.utcnow() + datetime.timedelta(days=7)},
+            {"user_id": user_id, "exp": int(time.time()) + TOKEN_LIFETIME},
             SECRET_KEY,
             algorithm="HS256"
         )
-        user_dict = dict(user)
-        user_dict.pop("password")
-        return jsonify({"message": "Login successful", "token": token, "user": user_dict}), 200
+        return jsonify({
+            "message": "Login successful",
+            "token": token,
+            "user": {"id": user_id, "name": name, "email": email, "created_at": created_at}
+        }), 200
 
     return jsonify({"error": "Invalid credentials"}), 401
 
@@ -186,68 +522,91 @@ def login():
 @app.route("/posts", methods=["POST"])
 @token_required
 def create_post(user_id):
-    data = request.json
-    title = data.get("title")
-    category = data.get("category")
-    content = data.get("content")
-
-    if not title or not category or not content:
-        return jsonify({"error": "All fields are required"}), 400
+    try:
+        body = parse_body(PostIn)
+    except msgspec.DecodeError as e:
+        return jsonify({"error": str(e)}), 400
+    title, category, content = body.title, body.category, body.content
 
     try:
-        conn = get_db()
-        with conn.cursor() as cur:
-            cur.execute(
-                "INSERT INTO posts (user_id, title, category, content) VALUES (%s, %s, %s, %s)",
-                (user_id, title, category, content)
-            )
-        conn.commit()
+        with db() as conn:
+            with conn.cursor() as cur:
+                cur.execute(SQL_INSERT_POST, (user_id, title, category, content))
+            conn.commit()
+        cache_delete(*variant_keys(POSTS_FEED_KEY, POSTS_PAGE_KEY))
         return jsonify({"message": "Post created successfully!"}), 201
     except Exception as e:
         return jsonify({"error": "Server error", "details": str(e)}), 500
-    finally:
-        conn.close()
+
+def encode_posts(cur):
+    # Tuple rows are streamed from the server and encoded one at a time.
+    # Returns the JSON array, the last row and the row count.
+    parts = []
+    row = None
+    for row in cur.fetchall_unbuffered():
+        parts.append(dump_json(dict(zip(POST_COLUMNS, row))))
+    return b"[" + b",".join(parts) + b"]", row, len(parts)
+
+def encode_cursor(row):
+    return f"{row[4].isoformat()}_{row[0]}"
+
+def decode_cursor(cursor):
+    created_at, _, post_id = cursor.rpartition("_")
+    return datetime.datetime.fromisoformat(created_at), int(post_id)
 
 @app.route("/posts", methods=["GET"])
 def get_posts():
+    # Without ?cursor or ?limit the whole feed is returned as a plain array
+    paginated = "cursor" in request.args or "limit" in request.args
+    limit = max(1, min(request.args.get("limit", POSTS_PAGE_SIZE, type=int), MAX_POSTS_PAGE_SIZE))
+    cursor = request.args.get("cursor")
+
+    cache_key = None
+    if not paginated:
+        sql, args, cache_key = SQL_LIST_POSTS, None, POSTS_FEED_KEY
+    elif cursor:
+        try:
+            created_at, post_id = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+        sql, args = SQL_LIST_POSTS_AFTER, (created_at, created_at, post_id, limit)
+    else:
+        sql, args = SQL_LIST_POSTS_PAGE, (limit,)
+        if limit == POSTS_PAGE_SIZE:
+            cache_key = POSTS_PAGE_KEY
+
+    if cache_key:
+        cached = cached_json_response(cache_key)
+        if cached is not None:
+            return cached
+
     try:
-        conn = get_db()
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT p.id, p.title, p.category, p.content, p.created_at, u.name as author,
-                       IFNULL(ROUND(AVG(r.rating),2),0) as avg_rating,
-                       COUNT(r.rating) as total_votes
-                FROM posts p
-                JOIN users u ON p.user_id = u.id
-                LEFT JOIN ratings r ON p.id = r.post_id
-                GROUP BY p.id, u.name
-                ORDER BY p.created_at DESC
-            """)
-            posts = cur.fetchall()
-        return jsonify(posts)
+        with db() as conn:
+            with conn.cursor(pymysql.cursors.SSCursor) as cur:
+                cur.execute(sql, args)
+                posts, last, count = encode_posts(cur)
     except Exception as e:
         return jsonify({"error": "Server error", "details": str(e)}), 500
-    finally:
-        conn.close()
+
+    if paginated:
+        next_cursor = encode_cursor(last) if count == limit else None
+        body = b'{"posts":' + posts + b',"next_cursor":' + dump_json(next_cursor) + b"}"
+    else:
+        body = posts
+    if cache_key:
+        return variant_response(cache_json(cache_key, body, POSTS_CACHE_TTL))
+    return json_response(body)
 
 @app.route("/test-db")
 def test_db():
     try:
-        conn = pymysql.connect(
-            host=os.environ.get("MYSQL_HOST"),
-            user=os.environ.get("MYSQL_USER"),
-            password=os.environ.get("MYSQL_PASSWORD"),
-            database=os.environ.get("MYSQL_DB"),
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        with conn.cursor() as cur:
-            cur.execute("SELECT 1")
-            result = cur.fetchone()
+        with db() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                result = cur.fetchone()
         return jsonify({"success": True, "result": result})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
-    finally:
-        conn.close()
 
 
 # -----------------------